@@ -13,11 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import gzip
+import io
 import json
 import logging
+import os
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Iterable, Iterator, List
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Union
 
 import cloudpickle
 import htcondor
@@ -30,17 +35,16 @@ logger = logging.getLogger(__name__)
 
 def save_object(obj: Any, path: Path) -> None:
     """Serialize a Python object (including "objects", like functions) to a file at the given ``path``."""
-    with gzip.open(path, mode="wb") as file:
-        cloudpickle.dump(obj, file)
+    _write_bytes(path, gzip.compress(cloudpickle.dumps(obj)))
 
 
-def load_object(path: Path) -> Any:
+def load_object(path: Union[str, Path]) -> Any:
     """Deserialize an object from the file at the given ``path``."""
     with gzip.open(path, mode="rb") as file:
         return cloudpickle.load(file)
 
 
-def load_objects(path: Path) -> Iterator[Any]:
+def load_objects(path: Union[str, Path]) -> Iterator[Any]:
     """Deserialize a stream of objects from the file at the given ``path``."""
     with gzip.open(path, mode="rb") as file:
         while True:
@@ -60,12 +64,57 @@ def save_inputs(map_dir: Path, args_and_kwargs: Iterable[ARGS_AND_KWARGS],) -> N
     Save the arguments to the mapped function to the map's input directory.
     """
     base_path = map_dir / names.INPUTS_DIR
-    for component, a_and_k in enumerate(args_and_kwargs):
-        save_object(a_and_k, base_path / f"{component}.{names.INPUT_EXT}")
+    # reuse a single pickler for all of the inputs, instead of setting up a new one each time
+    # clearing the memo between inputs keeps each pickle self-contained
+    buffer = io.BytesIO()
+    pickler = cloudpickle.CloudPickler(buffer, protocol=cloudpickle.DEFAULT_PROTOCOL)
+
+    # pickling holds the GIL, but compressing and writing don't,
+    # so those can run concurrently while the next input is pickled
+    # only a bounded number of pickled inputs are held in memory at once
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    max_in_flight = 2 * max_workers
+    in_flight: Deque[Future] = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for component, a_and_k in enumerate(args_and_kwargs):
+            buffer.seek(0)
+            buffer.truncate()
+            pickler.clear_memo()
+            pickler.dump(a_and_k)
+
+            if len(in_flight) >= max_in_flight:
+                in_flight.popleft().result()
+
+            in_flight.append(
+                pool.submit(
+                    _compress_and_save_bytes,
+                    buffer.getvalue(),
+                    base_path / f"{component}.{names.INPUT_EXT}",
+                )
+            )
+
+        for future in in_flight:
+            future.result()
 
     logger.debug(f"Saved args and kwargs in {base_path}")
 
 
+def _compress_and_save_bytes(data: bytes, path: Path) -> None:
+    """Write gzip-compressed ``data`` to the file at the given ``path``, in the same format as :func:`save_object`."""
+    _write_bytes(path, gzip.compress(data))
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to the file at the given ``path`` directly through its file descriptor."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while len(view) > 0:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def save_num_components(map_dir: Path, num_components: int) -> None:
     """Save the number of components in a map."""
     path = _num_components_path(map_dir)
@@ -121,10 +170,10 @@ def _submit_path(map_dir: Path) -> Path:
 def save_itemdata(map_dir: Path, itemdata: List[dict]) -> None:
     """Save the map's itemdata as a list of JSON dictionaries."""
     path = _itemdata_path(map_dir)
-    with path.open(mode="w") as f:
-        json.dump(
-            itemdata, f, indent=None, separators=(",", ":"),
-        )  # most compact representation
+    # json.dumps (unlike json.dump) uses the C encoder and gives us a single buffer to write
+    _write_bytes(
+        path, json.dumps(itemdata, indent=None, separators=(",", ":")).encode("utf-8"),
+    )  # most compact representation
 
     logger.debug(f"Saved itemdata to {path}")
 
@@ -19,6 +19,7 @@ import datetime
 import io
 import json
 import logging
+import os
 import shutil
 import textwrap
 import uuid
@@ -109,27 +110,34 @@ def clean(*, all: bool = False) -> List[str]:
         A list of the tags of the maps that were removed.
     """
     logger.debug("Cleaning maps...")
-    cleaned_tags = []
-    for map in load_maps():
-        if map.is_transient or all:
-            cleaned_tags.append(map.tag)
-            map.remove()
-
-    # clean up maps that were partially removed
-    # the "tagfiles" in this dir are named by uid instead of tag
-    # to guarantee uniqueness
-    for uid in (Path(settings["HTMAP_DIR"]) / names.REMOVED_TAGS_DIR).iterdir():
-        map_dir = mapping.map_dir_path(uuid.UUID(uid.stem))
-        try:
-            shutil.rmtree(map_dir)
-            logger.debug(f"Removed orphaned map directory {uid.stem}")
-        except (OSError, FileNotFoundError):
-            logger.exception(f"Failed to remove orphaned map directory {uid.stem}")
+    maps_to_clean = [map for map in load_maps() if map.is_transient or all]
+    cleaned_tags = [map.tag for map in maps_to_clean]
+
+    # removal is dominated by waiting on the schedd and the filesystem,
+    # so removing maps concurrently overlaps that waiting
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(lambda m: m.remove(), maps_to_clean))
+
+        # clean up maps that were partially removed
+        # the "tagfiles" in this dir are named by uid instead of tag
+        # to guarantee uniqueness
+        with os.scandir(Path(settings["HTMAP_DIR"]) / names.REMOVED_TAGS_DIR) as entries:
+            uids = [entry.name for entry in entries]
+        list(pool.map(_remove_orphaned_map_dir, uids))
 
     logger.debug(f"Cleaned maps {cleaned_tags}")
     return cleaned_tags
 
 
+def _remove_orphaned_map_dir(uid: str) -> None:
+    map_dir = mapping.map_dir_path(uuid.UUID(uid))
+    try:
+        shutil.rmtree(map_dir)
+        logger.debug(f"Removed orphaned map directory {uid}")
+    except (OSError, FileNotFoundError):
+        logger.exception(f"Failed to remove orphaned map directory {uid}")
+
+
 def _extract_status_data(
     map: maps.Map, include_state: bool = True, include_meta: bool = True,
 ) -> dict:
@@ -141,14 +149,26 @@ def _extract_status_data(
         sd.update({str(k): str(sc[k]) for k in state.ComponentStatus.display_statuses()})
 
     if include_meta:
+        runtime = map.runtime
         sd["Local Data"] = utils.num_bytes_to_str(map.local_data)
         sd["Max Memory"] = utils.num_bytes_to_str(max(map.memory_usage) * 1024 * 1024)
-        sd["Max Runtime"] = str(max(map.runtime))
-        sd["Total Runtime"] = str(sum(map.runtime, datetime.timedelta()))
+        sd["Max Runtime"] = str(max(runtime))
+        sd["Total Runtime"] = str(sum(runtime, datetime.timedelta()))
 
     return sd
 
 
+def _extract_meta_data(map: maps.Map) -> Dict[str, Union[int, float]]:
+    """Machine-readable disk, memory, and runtime information for :func:`status_json` and :func:`status_csv`."""
+    runtime = map.runtime
+    return {
+        "local_disk_usage": map.local_data,
+        "max_memory_usage": max(map.memory_usage) * 1024 * 1024,
+        "max_runtime": max(runtime).total_seconds(),
+        "total_runtime": sum(runtime, datetime.timedelta()).total_seconds(),
+    }
+
+
 def status(
     maps: Optional[Iterable[maps.Map]] = None,
     include_state: bool = True,
@@ -245,18 +265,15 @@ def status_json(
 
     j = {}
     for map in maps:
-        sc = collections.Counter(map.component_statuses)
         d: Dict[str, Union[dict, str, int, float]] = {"tag": map.tag}
         if include_state:
+            sc = collections.Counter(map.component_statuses)
             status_to_count = {}
             for status in state.ComponentStatus.display_statuses():
                 status_to_count[status.value.lower()] = sc[status]
             d["component_status_counts"] = status_to_count
         if include_meta:
-            d["local_disk_usage"] = utils.get_dir_size(mapping.map_dir_path(map.tag))
-            d["max_memory_usage"] = max(map.memory_usage) * 1024 * 1024
-            d["max_runtime"] = max(map.runtime).total_seconds()
-            d["total_runtime"] = sum(map.runtime, datetime.timedelta()).total_seconds()
+            d.update(_extract_meta_data(map))
 
         j[map.tag] = d
 
@@ -306,16 +323,13 @@ def status_csv(
 
     rows = []
     for map in maps:
-        sc = collections.Counter(map.component_statuses)
         row: Dict[str, Union[str, int, float]] = {"tag": map.tag}
         if include_state:
+            sc = collections.Counter(map.component_statuses)
             for status in state.ComponentStatus.display_statuses():
                 row[status.value.lower()] = sc[status]
         if include_meta:
-            row["local_disk_usage"] = utils.get_dir_size(mapping.map_dir_path(map.tag))
-            row["max_memory_usage"] = max(map.memory_usage) * 1024 * 1024
-            row["max_runtime"] = max(map.runtime).total_seconds()
-            row["total_runtime"] = sum(map.runtime, datetime.timedelta()).total_seconds()
+            row.update(_extract_meta_data(map))
 
         rows.append(row)
 
@@ -370,16 +384,9 @@ class Transplant(NamedTuple):
 
 
 def transplants() -> Tuple[Transplant, ...]:
-    return tuple(
-        sorted(
-            (
-                Transplant.load(p)
-                for p in Path(settings["TRANSPLANT.DIR"]).iterdir()
-                if p.suffix != ".pip"
-            ),
-            key=lambda t: t.created,
-        )
-    )
+    with os.scandir(settings["TRANSPLANT.DIR"]) as entries:
+        paths = [Path(entry.path) for entry in entries if not entry.name.endswith(".pip")]
+    return tuple(sorted((Transplant.load(p) for p in paths), key=lambda t: t.created))
 
 
 def transplant_info() -> str:
@@ -335,8 +335,10 @@ MAP_SUBDIR_NAMES = (
 
 def make_map_dir_and_subdirs(map_dir: Path) -> None:
     """Create the input, output, and log subdirectories inside the map directory."""
+    # the subdirectories share a parent, so only walk up the tree for the map directory itself
+    map_dir.mkdir(parents=True, exist_ok=True)
     for path in (map_dir / d for d in MAP_SUBDIR_NAMES):
-        path.mkdir(parents=True, exist_ok=True)
+        path.mkdir(exist_ok=True)
 
     logger.debug(f"Created map directory {map_dir} and subdirectories")
 
@@ -19,12 +19,25 @@ import datetime
 import functools
 import inspect
 import logging
+import os
 import shutil
 import time
 import weakref
-from copy import copy
+from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
 
 import classad
 import htcondor
@@ -59,6 +72,16 @@ def _protect_map_after_remove(result_class):
 # this set is used in Map.load to make Maps singletons
 MAPS = weakref.WeakSet()
 
+# how many components (counting the current one) Map.iter will load outputs for at once
+ITER_PREFETCH = 4
+
+
+def _wait_time(start_time: float, timeout: Optional[float]) -> float:
+    """How long to wait for new events before re-checking, given the remaining time before ``timeout``."""
+    if timeout is None:
+        return settings["WAIT_TIME"]
+    return min(settings["WAIT_TIME"], start_time + timeout - time.time())
+
 
 def maps_by_tag() -> Dict[str, "Map"]:
     """
@@ -90,6 +113,10 @@ class Map(collections.abc.Sequence):
 
         self._map_dir = map_dir
 
+        # component file paths are built in hot loops, so keep these directories as plain strings
+        self._inputs_dir_str = os.fspath(self._inputs_dir)
+        self._outputs_dir_str = os.fspath(self._outputs_dir)
+
         try:
             self._state = state.MapState.load(self)
             logger.debug(f"Loaded existing map state for map {self.tag}")
@@ -101,6 +128,9 @@ class Map(collections.abc.Sequence):
 
         self._local_data: Optional[int] = None
 
+        # loaded from the map directory the first time the map is (re-)submitted
+        self._submit_obj: Optional[htcondor.Submit] = None
+
         self._stdout: MapStdOut = MapStdOut(self)
         self._stderr: MapStdErr = MapStdErr(self)
         self._output_files: MapOutputFiles = MapOutputFiles(self)
@@ -178,11 +208,11 @@ class Map(collections.abc.Sequence):
         """The path to the outputs directory, inside the map directory."""
         return self._map_dir / names.OUTPUTS_DIR
 
-    def _input_file_path(self, component: int) -> Path:
-        return self._inputs_dir / f"{component}.{names.INPUT_EXT}"
+    def _input_file_path(self, component: int) -> str:
+        return os.path.join(self._inputs_dir_str, f"{component}.{names.INPUT_EXT}")
 
-    def _output_file_path(self, component: int) -> Path:
-        return self._outputs_dir / f"{component}.{names.OUTPUT_EXT}"
+    def _output_file_path(self, component: int) -> str:
+        return os.path.join(self._outputs_dir_str, f"{component}.{names.OUTPUT_EXT}")
 
     @property
     def _job_logs_dir(self) -> Path:
@@ -260,29 +290,39 @@ class Map(collections.abc.Sequence):
             if errors_ok:
                 ok_statuses.add(state.ComponentStatus.ERRORED)
 
+            # only look at the components that haven't finished yet
+            remaining_components = set(self.components)
             while True:
-                num_incomplete = sum(cs not in ok_statuses for cs in self.component_statuses)
-                if show_progress_bar:
-                    pbar_len = self._num_components - num_incomplete
-                    pbar.update(pbar_len - previous_pbar_len)
-                    previous_pbar_len = pbar_len
-                if num_incomplete == 0:
-                    break
-
-                for component, status in enumerate(self.component_statuses):
-                    if status is state.ComponentStatus.HELD and not holds_ok:
+                component_statuses = self.component_statuses
+                num_ok_holds = 0
+                for component in list(remaining_components):
+                    status = component_statuses[component]
+                    if status is state.ComponentStatus.HELD and holds_ok:
+                        # a held component may be released later, so keep checking it
+                        num_ok_holds += 1
+                    elif status in ok_statuses:
+                        remaining_components.discard(component)
+                    elif status is state.ComponentStatus.HELD:
                         raise exceptions.MapComponentHeld(
                             f"Component {component} of map {self.tag} was held. Reason: {self.holds[component]}"
                         )
-                    elif status is state.ComponentStatus.ERRORED and not errors_ok:
+                    elif status is state.ComponentStatus.ERRORED:
                         raise exceptions.MapComponentError(
                             f"Component {component} of map {self.tag} encountered error while executing. Error report:\n{self._load_error(component).report()}"
                         )
 
+                num_incomplete = len(remaining_components) - num_ok_holds
+                if show_progress_bar:
+                    pbar_len = self._num_components - num_incomplete
+                    pbar.update(pbar_len - previous_pbar_len)
+                    previous_pbar_len = pbar_len
+                if num_incomplete == 0:
+                    break
+
                 if timeout is not None and time.time() - timeout > start_time:
                     raise exceptions.TimeoutError(f"Timeout while waiting for {self}")
 
-                time.sleep(settings["WAIT_TIME"])
+                self._state._wait_for_events(_wait_time(start_time, timeout))
         finally:
             if show_progress_bar:
                 pbar.close()
@@ -316,7 +356,7 @@ class Map(collections.abc.Sequence):
                         f"Timed out while waiting for component {component} of map {self.tag}"
                     )
 
-            time.sleep(settings["WAIT_TIME"])
+            self._state._wait_for_events(_wait_time(start_time, timeout))
 
     def _load_input(self, component: int) -> Tuple[Tuple[Any], Dict[str, Any]]:
         return htio.load_object(self._input_file_path(component))
@@ -341,13 +381,21 @@ class Map(collections.abc.Sequence):
 
         self._wait_for_component(component, timeout)
 
+        return self._read_output(component)
+
+    def _read_output(self, component: int) -> Any:
+        """
+        Load the output of a map component that has already terminated,
+        raising :class:`MapComponentError` if it failed.
+        """
         status_and_result = htio.load_objects(self._output_file_path(component))
         status = next(status_and_result)
         if status == "OK":
             return next(status_and_result)
         elif status == "ERR":
+            error = errors.ComponentError._from_raw_error(self, next(status_and_result))
             raise exceptions.MapComponentError(
-                f"Component {component} of map {self.tag} encountered error while executing. Error report:\n{self._load_error(component).report()}"
+                f"Component {component} of map {self.tag} encountered error while executing. Error report:\n{error.report()}"
             )
         else:
             raise exceptions.InvalidOutputStatus(f"Output status {status} is not valid")
@@ -423,8 +471,7 @@ class Map(collections.abc.Sequence):
             How long to wait for each output to be available before raising a :class:`htmap.exceptions.TimeoutError`.
             If ``None``, wait forever.
         """
-        for component in self.components:
-            yield self._load_output(component, timeout=timeout)
+        yield from self._iter_in_order(self._read_output, timeout)
 
     def iter_with_inputs(
         self, timeout: utils.Timeout = None,
@@ -439,17 +486,44 @@ class Map(collections.abc.Sequence):
             How long to wait for each output to be available before raising a :class:`htmap.exceptions.TimeoutError`.
             If ``None``, wait forever.
         """
-        for component in self.components:
-            output = self._load_output(component, timeout=timeout)
-            input = self._load_input(component)
-            yield input, output
+        yield from self._iter_in_order(self._read_input_and_output, timeout)
+
+    def _read_input_and_output(self, component: int) -> Tuple[Tuple[tuple, Dict[str, Any]], Any]:
+        output = self._read_output(component)
+        return self._load_input(component), output
+
+    def _iter_in_order(self, read: Callable[[int], Any], timeout: utils.Timeout) -> Iterator[Any]:
+        """
+        Yield ``read(component)`` for each component in order, waiting on each component to terminate.
+        Later components that have already terminated are read ahead of time on a
+        small thread pool, so that loading their outputs overlaps with whatever
+        the caller is doing with the earlier ones.
+        """
+        components = self.components
+        terminated = (state.ComponentStatus.COMPLETED, state.ComponentStatus.ERRORED)
+
+        with ThreadPoolExecutor(max_workers=ITER_PREFETCH) as pool:
+            pending = {}
+            for component in components:
+                self._wait_for_component(component, timeout)
+
+                if component not in pending:
+                    pending[component] = pool.submit(read, component)
+
+                component_statuses = self.component_statuses
+                for ahead in components[component + 1 : component + ITER_PREFETCH]:
+                    if ahead not in pending and component_statuses[ahead] in terminated:
+                        pending[ahead] = pool.submit(read, ahead)
+
+                yield pending.pop(component).result()
 
     def iter_as_available(self, timeout: utils.Timeout = None,) -> Iterator[Any]:
         """
         Returns an iterator over the output of the :class:`htmap.Map`,
         yielding individual outputs as they become available.
 
-        The iteration order is initially random, but is consistent within a single interpreter session once the map is completed.
+        Components that have already finished are yielded first, in order;
+        after that, outputs are yielded in the order that the components finish.
 
         Parameters
         ----------
@@ -457,23 +531,7 @@ class Map(collections.abc.Sequence):
             How long to wait for the entire iteration to complete before raising a :class:`htmap.exceptions.TimeoutError`.
             If ``None``, wait forever.
         """
-        timeout = utils.timeout_to_seconds(timeout)
-        start_time = time.time()
-
-        remaining_indices = set(self.components)
-        while len(remaining_indices) > 0:
-            for component in copy(remaining_indices):
-                try:
-                    output = self._load_output(component, timeout=0)
-                    remaining_indices.remove(component)
-                    yield output
-                except exceptions.OutputNotFound:
-                    pass
-
-            if timeout is not None and time.time() > start_time + timeout:
-                raise exceptions.TimeoutError("Timed out while waiting for more output")
-
-            time.sleep(settings["WAIT_TIME"])
+        yield from self._iter_as_available(self._read_output, timeout)
 
     def iter_as_available_with_inputs(
         self, timeout: utils.Timeout = None,
@@ -482,7 +540,8 @@ class Map(collections.abc.Sequence):
         Returns an iterator over the inputs and output of the :class:`htmap.Map`,
         yielding individual ``(input, output)`` pairs as they become available.
 
-        The iteration order is initially random, but is consistent within a single interpreter session once the map is completed.
+        Components that have already finished are yielded first, in order;
+        after that, pairs are yielded in the order that the components finish.
 
         Parameters
         ----------
@@ -490,24 +549,60 @@ class Map(collections.abc.Sequence):
             How long to wait for the entire iteration to complete before raising a :class:`htmap.exceptions.TimeoutError`.
             If ``None``, wait forever.
         """
+        yield from self._iter_as_available(self._read_input_and_output, timeout)
+
+    def _iter_as_available(
+        self, read: Callable[[int], Any], timeout: utils.Timeout
+    ) -> Iterator[Any]:
+        """
+        Yield ``read(component)`` for each component as it terminates.
+        Instead of re-checking every remaining component on each pass,
+        this only looks at the components whose status has changed,
+        which the map state reports via a callback as it reads the event log.
+        """
         timeout = utils.timeout_to_seconds(timeout)
         start_time = time.time()
 
-        remaining_indices = set(self.components)
-        while len(remaining_indices) > 0:
-            for component in copy(remaining_indices):
-                try:
-                    output = self._load_output(component, timeout=0)
-                    input = self._load_input(component)
-                    remaining_indices.remove(component)
-                    yield input, output
-                except exceptions.OutputNotFound:
-                    pass
+        changed_components: Deque[int] = collections.deque()
+
+        def on_status_change(component: int, status: state.ComponentStatus) -> None:
+            changed_components.append(component)
 
-            if timeout is not None and time.time() > start_time + timeout:
-                raise exceptions.TimeoutError("Timed out while waiting for more output")
+        # register before looking at the current statuses, so that no changes are missed
+        self._state._add_status_callback(on_status_change)
+        try:
+            remaining_components = set(self.components)
+            changed_components.extend(self.components)
+            while len(remaining_components) > 0:
+                component_statuses = self.component_statuses
+                while len(changed_components) > 0:
+                    component = changed_components.popleft()
+                    if component not in remaining_components:
+                        continue
+
+                    status = component_statuses[component]
+                    if status in (state.ComponentStatus.COMPLETED, state.ComponentStatus.ERRORED):
+                        remaining_components.discard(component)
+                        yield read(component)
+                    elif status is state.ComponentStatus.HELD:
+                        raise exceptions.MapComponentHeld(
+                            f"Component {component} of map {self.tag} is held: {self.holds[component]}"
+                        )
 
-            time.sleep(settings["WAIT_TIME"])
+                if len(remaining_components) == 0:
+                    break
+
+                if timeout is not None and time.time() > start_time + timeout:
+                    raise exceptions.TimeoutError("Timed out while waiting for more output")
+
+                self._state._wait_for_events(_wait_time(start_time, timeout))
+
+                # if nothing was reported while waiting, re-check everything that's left,
+                # so that a missed status change can only delay a component, never lose it
+                if len(changed_components) == 0:
+                    changed_components.extend(sorted(remaining_components))
+        finally:
+            self._state._remove_status_callback(on_status_change)
 
     def iter_inputs(self) -> Iterator[Any]:
         """Returns an iterator over the inputs of the :class:`htmap.Map`."""
@@ -765,7 +860,7 @@ class Map(collections.abc.Sequence):
                 )
                 for cs in self.component_statuses
             ):
-                time.sleep(settings["WAIT_TIME"])
+                self._state._wait_for_events(settings["WAIT_TIME"])
 
         # move the tagfile to the removed tags dir
         # renamed by uid to prevent duplicates
@@ -910,14 +1005,12 @@ class Map(collections.abc.Sequence):
         if components is None:
             components = self.components
 
-        components = sorted(components)
+        components = set(components)
 
         itemdata = htio.load_itemdata(self._map_dir)
         sliced_itemdata = [item for item in itemdata if int(item["component"]) in components]
 
-        submit_obj = htio.load_submit(self._map_dir)
-
-        new_cluster_id = mapping.execute_submit(submit_obj, sliced_itemdata,)
+        new_cluster_id = mapping.execute_submit(self._submit_description, sliced_itemdata,)
 
         # if we fail to write the cluster id for any reason, abort the submit
         try:
@@ -929,6 +1022,13 @@ class Map(collections.abc.Sequence):
             f"Submitted {len(sliced_itemdata)} components (out of {self._num_components}) from map {self.tag}"
         )
 
+    @property
+    def _submit_description(self) -> htcondor.Submit:
+        """The map's :class:`htcondor.Submit`, loaded from the map directory the first time it is needed."""
+        if self._submit_obj is None:
+            self._submit_obj = htio.load_submit(self._map_dir)
+        return self._submit_obj
+
     def rerun(self, components: Optional[Iterable[int]] = None) -> None:
         """
         Re-run (part of) the map from scratch.
@@ -966,13 +1066,12 @@ class Map(collections.abc.Sequence):
                 f"Cannot rerun components {sorted(intersection)} of map {self.tag} because they are not complete"
             )
 
-        for path in (self._output_file_path(c) for c in components):
+        for c in components:
             try:
-                path.unlink()
+                os.unlink(self._output_file_path(c))
             except FileNotFoundError:
                 pass
-        for path in (self.output_files[c] for c in components):
-            shutil.rmtree(path, ignore_errors=True)
+            shutil.rmtree(self._user_output_files_path(c), ignore_errors=True)
 
         self._submit(components=components)
 
@@ -1001,9 +1100,11 @@ class Map(collections.abc.Sequence):
                 f"Cannot retag map because of previous exception: {e}"
             ) from e
 
-        submit_obj = htio.load_submit(self._map_dir)
+        submit_obj = htcondor.Submit(dict(self._submit_description))
         submit_obj["JobBatchName"] = tag
         htio.save_submit(self._map_dir, submit_obj)
+        # only update the cached submit description once the new one is saved
+        self._submit_obj = submit_obj
 
         # self._edit('JobBatchName', tag)  # todo: this doesn't seem to work as expected
 
@@ -15,10 +15,12 @@
 
 import datetime
 import logging
+import math
 import pickle
 import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
 import htcondor
 
@@ -84,6 +86,8 @@ class MapState:
 
         self._event_reader_lock = threading.Lock()
 
+        self._status_callbacks: List[Callable[[int, ComponentStatus], None]] = []
+
     @property
     def component_statuses(self) -> List[ComponentStatus]:
         self._read_events()
@@ -110,9 +114,7 @@ class MapState:
 
     def _read_events(self):
         with self._event_reader_lock:  # no thread can be in here at the same time as another
-            if self._event_reader is None:
-                logger.debug(f"Created event log reader for map {self.map.tag}")
-                self._event_reader = htcondor.JobEventLog(self._event_log_path.as_posix()).events(0)
+            self._ensure_event_reader()
 
             with utils.Timer() as timer:
                 handled_events = self._handle_events()
@@ -127,6 +129,51 @@ class MapState:
                 if utils.BINDINGS_VERSION_INFO >= (8, 9, 3):
                     self.save()
 
+    def _ensure_event_reader(self) -> None:
+        """Create the event log reader, if it doesn't exist yet. Must be called with the event reader lock held."""
+        if self._event_reader is None:
+            logger.debug(f"Created event log reader for map {self.map.tag}")
+            self._event_reader = htcondor.JobEventLog(self._event_log_path.as_posix()).events(0)
+
+    def _add_status_callback(self, callback: Callable[[int, ComponentStatus], None]) -> None:
+        """
+        Register a callback to be called with ``(component, new_status)``
+        whenever a component changes status.
+        Callbacks are called while the event log is being read, so they should be quick.
+        """
+        with self._event_reader_lock:
+            self._status_callbacks.append(callback)
+
+    def _remove_status_callback(self, callback: Callable[[int, ComponentStatus], None]) -> None:
+        with self._event_reader_lock:
+            self._status_callbacks.remove(callback)
+
+    def _wait_for_events(self, timeout: float) -> None:
+        """
+        Wait up to ``timeout`` seconds for a new event to arrive in the event log,
+        then process all new events.
+
+        HTCondor watches the event log for changes (via inotify, where available),
+        so this returns as soon as something happens to the map.
+        The event log reader can only block for whole seconds, so waits shorter
+        than a second just sleep, and longer waits are rounded down.
+        The blocking happens on a copy of the event log reader, which starts where
+        the reader currently is, without holding the lock that guards the map's state,
+        so other threads can keep reading it.
+        """
+        wait = math.floor(timeout)
+        if wait < 1:
+            time.sleep(max(timeout, 0))
+        else:
+            # the reader pickles with its position in the log, so this is a cheap way to copy it
+            with self._event_reader_lock:
+                self._ensure_event_reader()
+                waiter = pickle.loads(pickle.dumps(self._event_reader))
+
+            next(waiter.events(stop_after=wait), None)
+
+        self._read_events()
+
     def _handle_events(self) -> int:
         """
         Process new events and return the number of new events processed.
@@ -192,6 +239,8 @@ class MapState:
                     # might be helpful when debugging
                     # logger.debug(f'Component {component} of map {self.map.tag} changed state: {self._component_statuses[component]} -> {new_status}')
                     self._component_statuses[component] = new_status
+                    for callback in tuple(self._status_callbacks):
+                        callback(component, new_status)
 
         return handled_events
 
@@ -223,12 +272,14 @@ class MapState:
     def __getstate__(self):
         d = self.__dict__.copy()
         d.pop("_event_reader_lock")
+        d.pop("_status_callbacks")
         d.pop("map")
         return d
 
     def __setstate__(self, state):
         self.__dict__ = state
         self._event_reader_lock = threading.Lock()
+        self._status_callbacks = []
         # note: the map reference is restored in the load method
 
 
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import fnmatch
+import os
 import random
 import string
 from pathlib import Path
@@ -43,11 +44,12 @@ def get_tags(pattern: Optional[str] = None) -> Tuple[str, ...]:
     tags :
         A tuple containing the tags that match the ``pattern``.
     """
-    return tuple(
-        path.name
-        for path in tags_dir().iterdir()
-        if pattern is None or fnmatch.fnmatchcase(path.name, pattern)
-    )
+    with os.scandir(tags_dir()) as entries:
+        return tuple(
+            entry.name
+            for entry in entries
+            if pattern is None or fnmatch.fnmatchcase(entry.name, pattern)
+        )
 
 
 def tag_file_path(tag: str) -> Path:
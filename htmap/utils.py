@@ -54,16 +54,33 @@ def wait_for_path_to_exist(
     timeout
         The maximum amount of time to wait for the path to exist before raising a :class:`htmap.exceptions.TimeoutError`.
     wait_time
-        The time to wait between checks.
+        The maximum time to wait between checks.
+        Checks start out more frequent than this and back off exponentially.
     """
     timeout = timeout_to_seconds(timeout)
     wait_time = timeout_to_seconds(wait_time) or 0.01  # minimum wait time
+    backoff = Backoff(maximum=wait_time)
 
     start_time = time.time()
     while not path.exists():
         if timeout is not None and (timeout <= 0 or time.time() > start_time + timeout):
             raise exceptions.TimeoutError(f"Timeout while waiting for {path} to exist")
-        time.sleep(wait_time)
+        backoff.wait()
+
+
+class Backoff:
+    """
+    Sleeps for exponentially-increasing intervals, starting at ``initial``
+    seconds and doubling after each sleep, up to ``maximum`` seconds.
+    """
+
+    def __init__(self, maximum: float, initial: float = 0.05):
+        self.maximum = maximum
+        self.interval = min(initial, maximum)
+
+    def wait(self) -> None:
+        time.sleep(self.interval)
+        self.interval = min(self.interval * 2, self.maximum)
 
 
 Timeout = Optional[Union[int, float, datetime.timedelta]]
@@ -52,6 +52,11 @@ def test_iterating_over_held_component_raises(map_with_held_component):
         list(map_with_held_component)
 
 
+def test_iterating_as_available_over_held_component_raises(map_with_held_component):
+    with pytest.raises(htmap.exceptions.MapComponentHeld):
+        list(map_with_held_component.iter_as_available())
+
+
 def test_held_component_shows_up_in_hold_reasons(map_with_held_component):
     assert isinstance(map_with_held_component.holds[0], htmap.ComponentHold)
 
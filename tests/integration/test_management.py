@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+import io
+import json
 import shutil
 
 import pytest
@@ -94,3 +97,21 @@ def test_clean_all_cleans_all_maps(mapped_doubler):
     htmap.clean(all=True)
 
     assert len(htmap.get_tags()) == 0
+
+
+def test_status_json_reports_local_disk_usage(mapped_doubler):
+    m = mapped_doubler.map(range(1))
+    m.wait()
+
+    status = json.loads(htmap.status_json([m]))
+
+    assert status[m.tag]["local_disk_usage"] > 0
+
+
+def test_status_csv_reports_local_disk_usage(mapped_doubler):
+    m = mapped_doubler.map(range(1))
+    m.wait()
+
+    (row,) = csv.DictReader(io.StringIO(htmap.status_csv([m])))
+
+    assert int(row["local_disk_usage"]) > 0
@@ -14,6 +14,8 @@
 # limitations under the License.
 
 import datetime
+import os
+import time
 
 import pytest
 
@@ -83,3 +85,93 @@ def test_contains(mapped_doubler):
     assert 1 in m
     assert -1 not in m
     assert 5 not in m
+
+
+def test_iter_raises_for_errored_component_at_its_own_index():
+    def inverse(x):
+        return 1 / x
+
+    m = htmap.map(inverse, [1, 2, 0, 4])
+    m.wait(errors_ok=True)
+
+    # every component has finished, so later outputs are read ahead of the errored one
+    it = m.iter()
+    assert next(it) == 1
+    assert next(it) == 0.5
+    with pytest.raises(htmap.exceptions.MapComponentError):
+        next(it)
+
+
+@pytest.mark.timeout(60)
+def test_closing_iter_early_returns():
+    def first_finishes(x):
+        while x != 0:
+            time.sleep(1)
+        return x
+
+    m = htmap.map(first_finishes, [0, 1])
+
+    it = m.iter()
+    assert next(it) == 0
+    it.close()
+
+    m.remove()
+
+
+def test_iter_as_available_yields_finished_components_first_in_order(mapped_doubler):
+    m = mapped_doubler.map(range(3))
+    m.wait()
+
+    assert list(m.iter_as_available()) == [0, 2, 4]
+
+
+def test_iter_as_available_with_inputs_yields_finished_components_first_in_order(
+    mapped_doubler,
+):
+    m = mapped_doubler.map(range(3))
+    m.wait()
+
+    assert list(m.iter_as_available_with_inputs()) == [
+        (((0,), {}), 0),
+        (((1,), {}), 2),
+        (((2,), {}), 4),
+    ]
+
+
+# the test pool has a single slot sized to the machine's cpus,
+# so the components only run at the same time if there are at least two
+@pytest.mark.skipif(
+    (os.cpu_count() or 1) < 2, reason="components must be able to run at the same time"
+)
+@pytest.mark.timeout(300)
+def test_iter_as_available_yields_in_completion_order():
+    def sleep_then_return(x):
+        time.sleep(x)
+        return x
+
+    m = htmap.map(sleep_then_return, [10, 0])
+
+    assert list(m.iter_as_available()) == [0, 10]
+
+
+def test_iter_as_available_raises_for_errored_component():
+    def inverse(x):
+        return 1 / x
+
+    m = htmap.map(inverse, [0])
+
+    with pytest.raises(htmap.exceptions.MapComponentError):
+        list(m.iter_as_available())
+
+
+def test_closing_iter_as_available_removes_status_callback(mapped_doubler):
+    m = mapped_doubler.map(range(2))
+    m.wait()
+
+    it = m.iter_as_available()
+    next(it)
+    assert len(m._state._status_callbacks) == 1
+
+    it.close()
+
+    assert m._state._status_callbacks == []
@@ -18,7 +18,7 @@ from pathlib import Path
 import htcondor
 import pytest
 
-from htmap import htio
+from htmap import htio, names
 
 BUILTIN_OBJECTS = [
     5,
@@ -89,3 +89,18 @@ def test_save_and_load_itemdata(tmpdir):
     loaded = htio.load_itemdata(path)
 
     assert loaded == itemdata
+
+
+def test_save_inputs_round_trip(tmpdir):
+    map_dir = Path(tmpdir.mkdir("save_inputs_test_dir"))
+    (map_dir / names.INPUTS_DIR).mkdir()
+
+    args_and_kwargs = [((n,), {"k": str(n)}) for n in range(10)]
+
+    htio.save_inputs(map_dir, args_and_kwargs)
+
+    loaded = [
+        htio.load_object(map_dir / names.INPUTS_DIR / f"{n}.{names.INPUT_EXT}") for n in range(10)
+    ]
+
+    assert loaded == args_and_kwargs
@@ -0,0 +1,120 @@
+# Copyright 2018 HTCondor Team, Computer Sciences Department,
+# University of Wisconsin-Madison, WI.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import htmap
+from htmap import names
+from htmap.maps import _wait_time
+from htmap.state import ComponentStatus, MapState
+
+
+def submit_event(proc):
+    return (
+        f"000 (001.{proc:03d}.000) 2020-01-01 00:00:00 Job submitted from host: <127.0.0.1:9618>\n"
+        f"    {proc}\n"
+        "...\n"
+    )
+
+
+class FakeMap:
+    def __init__(self, map_dir: Path, num_components: int):
+        self._map_dir = map_dir
+        self.tag = "fake"
+        self.components = range(num_components)
+        self._local_data = None
+
+
+@pytest.fixture(scope="function")
+def map_state(tmp_path):
+    (tmp_path / names.EVENT_LOG).touch()
+    return MapState(FakeMap(tmp_path, 2))
+
+
+def append_event(map_state, event):
+    with (map_state.map._map_dir / names.EVENT_LOG).open(mode="a") as f:
+        f.write(event)
+
+
+def test_wait_time_without_timeout_is_wait_time():
+    htmap.settings["WAIT_TIME"] = 5
+
+    assert _wait_time(time.time(), None) == 5
+
+
+def test_wait_time_is_capped_by_remaining_timeout(mocker):
+    htmap.settings["WAIT_TIME"] = 5
+    mocker.patch("time.time", return_value=102)
+
+    assert _wait_time(100, 3) == 1
+
+
+def test_wait_time_is_negative_after_timeout_has_passed(mocker):
+    htmap.settings["WAIT_TIME"] = 5
+    mocker.patch("time.time", return_value=110)
+
+    assert _wait_time(100, 3) < 0
+
+
+@pytest.mark.parametrize("timeout", [0.1, 0, -1])
+def test_wait_for_events_sleeps_for_sub_second_timeouts(map_state, mocker, timeout):
+    sleep = mocker.patch("time.sleep")
+
+    map_state._wait_for_events(timeout)
+
+    sleep.assert_called_once_with(max(timeout, 0))
+
+
+@pytest.mark.timeout(10)
+def test_wait_for_events_returns_when_event_is_appended(map_state):
+    def append_later():
+        time.sleep(0.5)
+        append_event(map_state, submit_event(0))
+
+    thread = threading.Thread(target=append_later)
+    thread.start()
+
+    start = time.time()
+    map_state._wait_for_events(5)
+    thread.join()
+
+    assert time.time() - start < 4
+    assert map_state._component_statuses[0] is ComponentStatus.IDLE
+
+
+@pytest.mark.timeout(10)
+def test_wait_for_events_does_not_block_on_unread_event(map_state):
+    map_state._read_events()
+    append_event(map_state, submit_event(0))
+
+    start = time.time()
+    map_state._wait_for_events(5)
+
+    assert time.time() - start < 1
+    assert map_state._component_statuses[0] is ComponentStatus.IDLE
+
+
+@pytest.mark.timeout(10)
+def test_wait_for_events_blocks_for_whole_seconds_without_events(map_state):
+    map_state._read_events()
+
+    start = time.time()
+    map_state._wait_for_events(1.9)
+
+    assert 0.9 < time.time() - start < 1.5
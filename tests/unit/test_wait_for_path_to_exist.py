@@ -19,7 +19,7 @@ from pathlib import Path
 import pytest
 
 import htmap
-from htmap.utils import timeout_to_seconds, wait_for_path_to_exist
+from htmap.utils import Backoff, timeout_to_seconds, wait_for_path_to_exist
 
 
 def test_returns_when_path_does_exist():
@@ -41,3 +41,17 @@ def test_timeout_on_nonexistent_path(timeout):
 )
 def test_timeout_to_seconds(timeout, expected):
     assert timeout_to_seconds(timeout) == expected
+
+
+def test_backoff_doubles_up_to_maximum(mocker):
+    sleep = mocker.patch("time.sleep")
+    backoff = Backoff(maximum=0.3, initial=0.1)
+
+    for _ in range(4):
+        backoff.wait()
+
+    assert [c[0][0] for c in sleep.call_args_list] == [0.1, 0.2, 0.3, 0.3]
+
+
+def test_backoff_initial_is_capped_by_maximum():
+    assert Backoff(maximum=0.01).interval == 0.01